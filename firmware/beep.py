@@ -4,13 +4,41 @@ Generates sine-wave tones at configurable frequency and duration.
 No-ops gracefully on boards without a speaker (board.HAS_BEEP is False).
 """
 
+import array
 import math
-import struct
+import micropython
 import board
 
 _i2s = None
 _SAMPLE_RATE = 8000
 
+# Generated PCM buffers keyed by (freq, duration_ms). Status beeps reuse a
+# handful of tones, so caching skips the sine loop on every repeat. Durations
+# come from the host, so the cache is capped by total bytes with FIFO eviction,
+# and tones longer than 250 ms (8 KB) are generated per call and never cached.
+_TONE_CACHE_BYTES = 16 * 1024
+_TONE_MAX_BYTES = 8 * 1024
+_tone_cache = {}
+_tone_keys = []
+_tone_bytes = 0
+
+# Gap between repeated beeps. Played as a short zero chunk written several
+# times, so the shared silence buffer is 1.6 KB rather than a full 12.8 KB gap.
+_GAP_MS = 400
+_SILENCE_CHUNK_MS = 50
+_silence = None
+
+# Quarter-wave sine table (257 entries so index 256 mirrors cleanly), scaled
+# to the tone amplitude. Built once at import so the sample loop needs no
+# float math: a phase accumulator picks the quadrant and the table index.
+_AMPLITUDE = 16000
+_SIN_Q = array.array(
+    "h", [int(_AMPLITUDE * math.sin(math.pi / 2 * k / 256)) for k in range(257)]
+)
+# Phase is 18-bit fixed point per cycle: bits 16..17 select the quadrant,
+# bits 8..15 index _SIN_Q, the low byte is fractional.
+_PHASE_BITS = 18
+
 
 def init():
     """Configure I2S output using board-specific pin assignments."""
@@ -31,28 +59,73 @@ def init():
     )
 
 
+@micropython.viper
+def _fill_tone(buf, n: int, phase_inc: int, lut) -> int:
+    """Fill `buf` with n stereo int16 frames from the quarter-wave table.
+
+    Compiled to native code by viper, so the per-sample loop runs without
+    bytecode dispatch. ptr16 loads are unsigned, which is fine because the
+    table only holds the non-negative first quadrant; the sign is applied here.
+    Both channels carry the same sample, so each frame is one 32-bit store
+    (left in the low half, little-endian).
+    """
+    out = ptr32(buf)
+    tab = ptr16(lut)
+    phase = 0
+    for i in range(n):
+        idx = (phase >> 8) & 0xFF
+        q = phase >> 16
+        if q & 1:
+            v = int(tab[256 - idx])
+        else:
+            v = int(tab[idx])
+        if q & 2:
+            v = 0 - v
+        out[i] = (v & 0xFFFF) | (v << 16)
+        phase = (phase + phase_inc) & 0x3FFFF  # wrap at _PHASE_BITS
+    return n
+
+
 def _generate_tone(freq, duration_ms):
-    """Generate a stereo 16-bit PCM sine wave buffer."""
+    """Generate a stereo 16-bit PCM sine wave as a new bytearray."""
     n_samples = (_SAMPLE_RATE * duration_ms) // 1000
     buf = bytearray(n_samples * 4)  # 2 bytes/sample * 2 channels
-    for i in range(n_samples):
-        val = int(16000 * math.sin(2 * math.pi * freq * i / _SAMPLE_RATE))
-        struct.pack_into("<hh", buf, i * 4, val, val)
+    _fill_tone(buf, n_samples, (freq << _PHASE_BITS) // _SAMPLE_RATE, _SIN_Q)
     return buf
 
 
+def _get_tone(freq, duration_ms):
+    """Return the cached PCM buffer for (freq, duration_ms), generating on miss."""
+    global _tone_bytes
+    key = (freq, duration_ms)
+    tone = _tone_cache.get(key)
+    if tone is None:
+        tone = _generate_tone(freq, duration_ms)
+        size = len(tone)
+        if size > _TONE_MAX_BYTES:
+            return tone
+        while _tone_keys and _tone_bytes + size > _TONE_CACHE_BYTES:
+            _tone_bytes -= len(_tone_cache.pop(_tone_keys.pop(0)))
+        _tone_cache[key] = tone
+        _tone_keys.append(key)
+        _tone_bytes += size
+    return tone
+
+
 def beep(freq=1000, duration_ms=200, repeat=1):
     """Play a tone. Blocks until complete. Lazy-inits I2S on first call."""
-    global _i2s
+    global _i2s, _silence
     if not board.HAS_BEEP:
         return
     if _i2s is None:
         init()
         if _i2s is None:
             return
-    tone = _generate_tone(freq, duration_ms)
-    silence = _generate_tone(0, 400) if repeat > 1 else None
+    tone = _get_tone(freq, duration_ms)
+    if repeat > 1 and _silence is None:
+        _silence = bytes(_SAMPLE_RATE * _SILENCE_CHUNK_MS // 1000 * 4)
     for i in range(repeat):
         _i2s.write(tone)
-        if silence and i < repeat - 1:
-            _i2s.write(silence)
+        if i < repeat - 1:
+            for _ in range(_GAP_MS // _SILENCE_CHUNK_MS):
+                _i2s.write(_silence)
@@ -6,8 +6,10 @@ board abstraction layer so this module works on ESP32 and ESP32-S3.
 
 import aioble
 import asyncio
+import binascii
 import bluetooth
 import board
+import micropython
 
 _ble = bluetooth.BLE()
 
@@ -66,7 +68,24 @@ def _should_skip_connect(free, largest, min_free, min_largest):
 
 
 def _norm_uuid(uuid):
-    """Convert MicroPython UUID to normalized 32-char hex (matches Node.js normalizeUuid)."""
+    """Convert MicroPython UUID to normalized 32-char hex (matches Node.js normalizeUuid).
+
+    bluetooth.UUID exposes its raw little-endian value through the buffer
+    protocol, which avoids parsing its repr (the repr format has changed across
+    MicroPython versions). Anything without a 2/4/16-byte buffer falls back to
+    normalizing the string form.
+    """
+    if not isinstance(uuid, str):
+        try:
+            raw = bytes(uuid)
+        except TypeError:
+            raw = b""
+        if len(raw) == 2:
+            return "0000" + binascii.hexlify(raw[::-1]).decode() + _BT_BASE_SUFFIX
+        if len(raw) == 4:
+            return binascii.hexlify(raw[::-1]).decode() + _BT_BASE_SUFFIX
+        if len(raw) == 16:
+            return binascii.hexlify(raw[::-1]).decode()
     s = str(uuid)
     # "UUID(0x2a9d)" -> "00002a9d" + base suffix
     if s.startswith("UUID(0x") and s.endswith(")"):
@@ -77,45 +96,64 @@ def _norm_uuid(uuid):
     return s.lower().replace("-", "")
 
 
-def _parse_raw_entry(addr_bytes, addr_type, rssi, raw):
-    """Parse a single raw BLE advertisement into a device dict.
+# hexlify(data, sep) inserts the separator in C; probe once in case a port
+# was built without it.
+try:
+    _HEX_SEP = binascii.hexlify(b"\x00\x00", ":") == b"00:00"
+except TypeError:
+    _HEX_SEP = False
 
-    Handles 16/32/128-bit Service UUIDs (AD types 0x02-0x07) and Service Data
-    (0x16/0x20/0x21). UUIDs are advertised little-endian per BT Core spec;
-    32-bit and 128-bit UUIDs are emitted as the full 32-char canonical form
-    (32-bit expanded via the Bluetooth base UUID) because Node-side
-    normalizeUuid only expands the 4-char (16-bit) form. 16-bit UUIDs are kept
-    as 4-char hex so existing adapters and Node-side normalization continue to
-    match.
+
+def _format_mac(addr_bytes):
+    """Format 6 address bytes as an uppercase colon-separated MAC string.
+
+    One C-level hexlify instead of six Python %-formats, since this runs for
+    every advertisement in a scan.
     """
-    mac = ":".join("%02X" % b for b in addr_bytes)
-    name = ""
+    if _HEX_SEP:
+        return binascii.hexlify(addr_bytes, ":").decode().upper()
+    h = binascii.hexlify(addr_bytes).decode().upper()
+    return ":".join((h[0:2], h[2:4], h[4:6], h[6:8], h[8:10], h[10:12]))
+
+
+@micropython.native
+def _parse_ad(raw):
+    """Walk the AD structures of one advertisement.
+
+    Pure integer byte twiddling, compiled with the native emitter because it
+    runs for every advertisement in a scan. Returns (name_bytes, services,
+    service_data, mfr_id, mfr_payload): services are finished UUID strings,
+    service_data is a list of (uuid, payload_bytes) and mfr_payload is the raw
+    bytes after the company ID; text decoding and hex encoding of the payloads
+    is left to the caller. Missing fields are None (empty list for services).
+    `raw` may be a memoryview into the scan buffer, in which case the returned
+    payloads are views too (slicing a memoryview does not copy).
+    """
+    name = None
     services = []
     service_data = []
     mfr_id = None
-    mfr_data = None
+    mfr_payload = None
 
+    n = len(raw)
     i = 0
-    while i < len(raw):
+    while i < n:
         length = raw[i]
         if length == 0:
             break
-        if i + 1 >= len(raw):
+        if i + 1 >= n:
             break
         ad_type = raw[i + 1]
         ad_payload = raw[i + 2:i + 1 + length]
+        plen = len(ad_payload)
 
         if ad_type == 0x09 or ad_type == 0x08:  # Local Name
-            try:
-                name = ad_payload.decode("utf-8")
-            except Exception:
-                pass
+            name = ad_payload
         elif ad_type == 0x03 or ad_type == 0x02:  # 16-bit Service UUIDs
-            for j in range(0, len(ad_payload) - 1, 2):
-                uuid = ad_payload[j] | (ad_payload[j + 1] << 8)
-                services.append("%04x" % uuid)
+            for j in range(0, plen - 1, 2):
+                services.append("%04x" % (ad_payload[j] | (ad_payload[j + 1] << 8)))
         elif ad_type == 0x05 or ad_type == 0x04:  # 32-bit Service UUIDs
-            for j in range(0, len(ad_payload) - 3, 4):
+            for j in range(0, plen - 3, 4):
                 val = (
                     ad_payload[j]
                     | (ad_payload[j + 1] << 8)
@@ -124,31 +162,60 @@ def _parse_raw_entry(addr_bytes, addr_type, rssi, raw):
                 )
                 services.append("%08x" % val + _BT_BASE_SUFFIX)
         elif ad_type == 0x07 or ad_type == 0x06:  # 128-bit Service UUIDs
-            for j in range(0, len(ad_payload) - 15, 16):
-                services.append(ad_payload[j:j + 16][::-1].hex())
-        elif ad_type == 0x16 and len(ad_payload) >= 2:  # Service Data — 16-bit
+            for j in range(0, plen - 15, 16):
+                services.append(bytes(ad_payload[j:j + 16])[::-1].hex())
+        elif ad_type == 0x16 and plen >= 2:  # Service Data — 16-bit
             uuid = "%04x" % (ad_payload[0] | (ad_payload[1] << 8))
-            service_data.append({"uuid": uuid, "data": ad_payload[2:].hex()})
-        elif ad_type == 0x20 and len(ad_payload) >= 4:  # Service Data — 32-bit
+            service_data.append((uuid, ad_payload[2:]))
+        elif ad_type == 0x20 and plen >= 4:  # Service Data — 32-bit
             val = (
                 ad_payload[0]
                 | (ad_payload[1] << 8)
                 | (ad_payload[2] << 16)
                 | (ad_payload[3] << 24)
             )
-            uuid = "%08x" % val + _BT_BASE_SUFFIX
-            service_data.append({"uuid": uuid, "data": ad_payload[4:].hex()})
-        elif ad_type == 0x21 and len(ad_payload) >= 16:  # Service Data — 128-bit
-            uuid = ad_payload[0:16][::-1].hex()
-            service_data.append({"uuid": uuid, "data": ad_payload[16:].hex()})
+            service_data.append(("%08x" % val + _BT_BASE_SUFFIX, ad_payload[4:]))
+        elif ad_type == 0x21 and plen >= 16:  # Service Data — 128-bit
+            service_data.append((bytes(ad_payload[0:16])[::-1].hex(), ad_payload[16:]))
         elif ad_type == 0xFF and length >= 3:  # Manufacturer Specific
             mfr_id = ad_payload[0] | (ad_payload[1] << 8)
-            mfr_data = ad_payload[2:].hex()
+            mfr_payload = ad_payload[2:]
 
         i += length + 1
 
+    return name, services, service_data, mfr_id, mfr_payload
+
+
+def _parse_raw_entry(addr_bytes, addr_type, rssi, raw):
+    """Parse a single raw BLE advertisement into a device dict with its MAC."""
+    entry = _parse_adv(addr_type, rssi, raw)
+    entry["address"] = _format_mac(addr_bytes)
+    return entry
+
+
+def _parse_adv(addr_type, rssi, raw):
+    """Parse a single raw BLE advertisement into a device dict, minus "address".
+
+    The scan paths key their dedup dict by the raw address bytes and only
+    format the MAC for devices that survive the filter (see _collect_results).
+
+    Handles 16/32/128-bit Service UUIDs (AD types 0x02-0x07) and Service Data
+    (0x16/0x20/0x21). UUIDs are advertised little-endian per BT Core spec;
+    32-bit and 128-bit UUIDs are emitted as the full 32-char canonical form
+    (32-bit expanded via the Bluetooth base UUID) because Node-side
+    normalizeUuid only expands the 4-char (16-bit) form. 16-bit UUIDs are kept
+    as 4-char hex so existing adapters and Node-side normalization continue to
+    match.
+    """
+    name_bytes, services, service_data, mfr_id, mfr_payload = _parse_ad(raw)
+    name = ""
+    if name_bytes:
+        try:
+            name = bytes(name_bytes).decode("utf-8")
+        except Exception:
+            pass
+
     entry = {
-        "address": mac,
         "name": name,
         "rssi": rssi,
         "services": services,
@@ -156,15 +223,23 @@ def _parse_raw_entry(addr_bytes, addr_type, rssi, raw):
     }
     if mfr_id is not None:
         entry["manufacturer_id"] = mfr_id
-        entry["manufacturer_data"] = mfr_data
+        entry["manufacturer_data"] = binascii.hexlify(mfr_payload).decode()
     if service_data:
-        entry["service_data"] = service_data
+        entry["service_data"] = [
+            {"uuid": uuid, "data": binascii.hexlify(data).decode()}
+            for uuid, data in service_data
+        ]
     return entry
 
 
-def _merge_entry(seen, entry):
-    """Merge a parsed device entry into the seen dict (dedup by MAC, strongest RSSI)."""
-    mac = entry["address"]
+def _merge_entry(seen, entry, mac=None):
+    """Merge a parsed device entry into the seen dict (dedup by MAC, strongest RSSI).
+
+    `mac` is the dedup key, defaulting to entry["address"]; the scan paths pass
+    the raw address bytes, which hash cheaper than the 17-char string.
+    """
+    if mac is None:
+        mac = entry["address"]
     if mac in seen:
         if entry["rssi"] > seen[mac]["rssi"]:
             seen[mac]["rssi"] = entry["rssi"]
@@ -181,17 +256,55 @@ def _merge_entry(seen, entry):
         seen[mac] = entry
 
 
-def _raw_has_mac(raw_results, macs):
+def _collect_results(seen):
+    """Return the seen entries worth reporting, formatting MACs on the way out.
+
+    Only devices with a name, manufacturer data or services pass; in a dense
+    environment that is a small fraction of the advertisers, so MAC strings
+    are built for the output set rather than every advertisement.
+    """
+    results = []
+    for addr_bytes, v in seen.items():
+        if v["name"] or v.get("manufacturer_data") or v.get("services") or v.get("service_data"):
+            if "address" not in v:
+                v["address"] = _format_mac(addr_bytes)
+            results.append(v)
+    return results
+
+
+def _find_raw_mac(raw_results, macs, n=None):
+    """First raw scan tuple advertising an address in `macs`, or None.
+
+    Returns (mac, addr_bytes, addr_type). `macs` is a set of uppercase
+    colon-separated MAC strings (the format carried on the `config` topic).
+    Only the first `n` tuples are checked (default: all), so a _RawScanBuffer's
+    slot list can be walked in place instead of copied.
+
+    The controller-reported addr_type (the advertising PDU TxAdd bit) is
+    authoritative and is passed through unchanged. An earlier build forced
+    addr_type=1 whenever addr[0] & 0xC0 == 0xC0 on the theory that an FF address
+    must be random static, but a public address may use any bytes and cheap scale
+    SoCs advertise arbitrary public addresses that also start with 0xFF, so that
+    override connected the QN-Scale as random and it never matched the public
+    advertiser (#231).
+    """
+    if n is None:
+        n = len(raw_results)
+    for k in range(n):
+        addr_bytes, addr_type, _rssi, _raw = raw_results[k]
+        mac = _format_mac(addr_bytes)
+        if mac in macs:
+            return mac, addr_bytes, addr_type
+    return None
+
+
+def _raw_has_mac(raw_results, macs, n=None):
     """True if any raw scan tuple advertises an address in `macs`.
 
-    `macs` is a set of uppercase colon-separated MAC strings (the format
-    carried on the `config` topic). Non-destructive peek of the streaming IRQ
-    buffer — lets the publish loop flush early for a known scale (#201).
+    Non-destructive peek of the streaming IRQ buffer — lets the publish loop
+    flush early for a known scale (#201).
     """
-    for addr_bytes, _addr_type, _rssi, _raw in raw_results:
-        if ":".join("%02X" % b for b in addr_bytes) in macs:
-            return True
-    return False
+    return _find_raw_mac(raw_results, macs, n) is not None
 
 
 def _unpack_scan_result(data):
@@ -226,6 +339,52 @@ def _addr_type_probe_order(addr_type):
     return (primary, primary ^ 1)
 
 
+# Legacy advertising payloads are at most 31 bytes (BT Core spec), so each
+# slot of the payload pool is that size.
+_ADV_MAX = 31
+
+
+class _RawScanBuffer:
+    """Fixed-capacity store for raw scan tuples filled from the BLE IRQ.
+
+    The slot list and one contiguous payload pool are allocated once up front.
+    The IRQ copies each advertisement into its pool slot and stores a
+    memoryview of it, instead of growing a list and allocating a fresh bytes
+    object per advertisement. The views stay valid until clear(), so entries
+    must be parsed before the buffer is reused.
+    """
+
+    def __init__(self, capacity):
+        self.slots = [None] * capacity
+        self.pool = memoryview(bytearray(capacity * _ADV_MAX))
+        self.n = 0
+
+    def add(self, addr, addr_type, rssi, adv_data):
+        """Store one advertisement in the next free slot (caller checks capacity)."""
+        k = self.n
+        size = len(adv_data)
+        if size <= _ADV_MAX:
+            off = k * _ADV_MAX
+            self.pool[off:off + size] = adv_data
+            adv = self.pool[off:off + size]
+        else:
+            # Extended advertising can exceed the legacy slot; copy as before.
+            adv = bytes(adv_data)
+        self.slots[k] = (bytes(addr), addr_type, rssi, adv)
+        self.n = k + 1
+
+    def entries(self):
+        """Filled slots as a new list. Allocates, so call outside the IRQ."""
+        return self.slots[:self.n]
+
+    def clear(self):
+        """Drop the stored tuples (so the GC can reclaim them) and reset."""
+        slots = self.slots
+        for k in range(self.n):
+            slots[k] = None
+        self.n = 0
+
+
 class BleBridge:
     def __init__(self):
         self._conn = None
@@ -235,10 +394,20 @@ class BleBridge:
         self._disconnect_fired = False
         # Streaming scan state
         self._streaming = False
-        self._raw_results = []
+        # Double-buffered so drain_results() can swap in an empty buffer with
+        # a single attribute store while the IRQ keeps filling.
+        self._scan_buf = None
+        self._spare_buf = None
+        # Batch scan buffer reused across scan() calls on boards with heap to
+        # spare. AGGRESSIVE_GC boards build it per scan and free it before the
+        # post-scan GC so the pool is not pinned ahead of connect() (#139).
+        self._batch_buf = None
         self._seen = {}
         self._seen_cycle = 0
         self._cap_logged = False
+        # Per-board IRQ capture cap, read once (a board file that predates the
+        # setting gets the Atom Echo's 200).
+        self._max_scan = getattr(board, "MAX_SCAN_ENTRIES", 200)
 
     def set_on_disconnect(self, callback):
         """Set callback for unexpected peripheral disconnect (fires at most once)."""
@@ -273,21 +442,30 @@ class BleBridge:
         if duration_ms is None:
             duration_ms = board.SCAN_DURATION_MS
 
+        # Full GC walks the whole heap and can stall for tens of ms, so only
+        # boards that opt into aggressive GC (no PSRAM) collect around a scan.
         import gc
-        gc.collect()
-        seen = {}  # address -> dict
-        raw_results = []  # collect raw IRQ data
+        aggressive_gc = getattr(board, "AGGRESSIVE_GC", True)
+        if aggressive_gc:
+            gc.collect()
+        seen = {}  # address bytes -> dict
+        raw = None if aggressive_gc else self._batch_buf  # collect raw IRQ data
+        if raw is None:
+            raw = _RawScanBuffer(self._max_scan)
+            if not aggressive_gc:
+                self._batch_buf = raw
+        raw.clear()
 
         _cap_logged = False
         _oom_logged = False
 
         def _irq(event, data):
             nonlocal _cap_logged, _oom_logged
-            if event == 5:  # _IRQ_SCAN_RESULT
-                if len(raw_results) < board.MAX_SCAN_ENTRIES:
+            if event == 5 and raw is not None:  # _IRQ_SCAN_RESULT
+                if raw.n < len(raw.slots):
                     addr_type, addr, rssi, adv_data = _unpack_scan_result(data)
                     try:
-                        raw_results.append((bytes(addr), addr_type, rssi, bytes(adv_data)))
+                        raw.add(addr, addr_type, rssi, adv_data)
                     except MemoryError:
                         # Drop this advertisement instead of letting the OOM
                         # propagate out of the IRQ. An unhandled IRQ exception
@@ -297,7 +475,7 @@ class BleBridge:
                             print("Scan IRQ low memory, dropping results (lower MAX_SCAN_ENTRIES)")
                 elif not _cap_logged:
                     _cap_logged = True
-                    print(f"Scan entry cap reached ({board.MAX_SCAN_ENTRIES}), ignoring further results")
+                    print(f"Scan entry cap reached ({self._max_scan}), ignoring further results")
 
         _ble.active(True)
         try:
@@ -309,20 +487,12 @@ class BleBridge:
             except Exception:
                 pass
 
-            for addr_bytes, addr_type, rssi, raw in raw_results:
-                entry = _parse_raw_entry(addr_bytes, addr_type, rssi, raw)
-                _merge_entry(seen, entry)
-
-            results = [
-                v
-                for v in seen.values()
-                if v["name"]
-                or v.get("manufacturer_data")
-                or v.get("services")
-                or v.get("service_data")
-            ]
+            for addr_bytes, addr_type, rssi, adv_raw in raw.entries():
+                _merge_entry(seen, _parse_adv(addr_type, rssi, adv_raw), addr_bytes)
+
+            results = _collect_results(seen)
             seen.clear()
-            raw_results.clear()
+            raw.clear()
             return results
         finally:
             if board.DEACTIVATE_BLE_AFTER_SCAN:
@@ -330,7 +500,9 @@ class BleBridge:
                     _ble.active(False)
                 except Exception:
                     pass
-            gc.collect()
+            if aggressive_gc:
+                raw = None  # unpin the pool so the GC below can free it
+                gc.collect()
 
     def start_streaming(self):
         """Start an indefinite BLE scan (ESP32-S3 continuous mode).
@@ -338,10 +510,12 @@ class BleBridge:
         IRQ handler accumulates raw results; call drain_results() periodically
         to process and publish them.
         """
-        import gc
-        gc.collect()
+        if getattr(board, "AGGRESSIVE_GC", True):
+            import gc
+            gc.collect()
         self._streaming = True
-        self._raw_results = []
+        self._scan_buf = _RawScanBuffer(self._max_scan)
+        self._spare_buf = _RawScanBuffer(self._max_scan)
         self._seen = {}
         self._seen_cycle = 0
         self._cap_logged = False
@@ -349,10 +523,13 @@ class BleBridge:
 
         def _irq(event, data):
             if event == 5:  # _IRQ_SCAN_RESULT
-                if len(self._raw_results) < board.MAX_SCAN_ENTRIES:
+                buf = self._scan_buf
+                if buf is None:
+                    return
+                if buf.n < len(buf.slots):
                     addr_type, addr, rssi, adv_data = _unpack_scan_result(data)
                     try:
-                        self._raw_results.append((bytes(addr), addr_type, rssi, bytes(adv_data)))
+                        buf.add(addr, addr_type, rssi, adv_data)
                     except MemoryError:
                         # Drop this advertisement instead of letting the OOM
                         # propagate out of the IRQ. An unhandled IRQ exception
@@ -362,7 +539,7 @@ class BleBridge:
                             print("Streaming scan IRQ low memory, dropping results (lower MAX_SCAN_ENTRIES)")
                 elif not self._cap_logged:
                     self._cap_logged = True
-                    print(f"Streaming scan cap reached ({board.MAX_SCAN_ENTRIES}), ignoring until drain")
+                    print(f"Streaming scan cap reached ({self._max_scan}), ignoring until drain")
 
         _ble.active(True)
         _ble.irq(_irq)
@@ -373,7 +550,22 @@ class BleBridge:
         """True when the streaming IRQ buffer holds an advertisement from a
         known scale MAC, so the publish loop can flush early instead of
         waiting out the full PUBLISH_INTERVAL_MS (#201)."""
-        return _raw_has_mac(self._raw_results, macs)
+        buf = self._scan_buf
+        if buf is None:
+            return False
+        return _raw_has_mac(buf.slots, macs, buf.n)
+
+    def find_pending_scale(self, macs):
+        """Find the first known scale in the streaming IRQ buffer.
+
+        Returns (mac, addr_bytes, addr_type) or None. Non-destructive peek used
+        by the autonomous connect logic to skip the MQTT round-trip (#201); the
+        buffer is walked in place, not copied.
+        """
+        buf = self._scan_buf
+        if buf is None:
+            return None
+        return _find_raw_mac(buf.slots, macs, buf.n)
 
     def drain_results(self):
         """Drain accumulated raw scan results and return filtered device list.
@@ -381,38 +573,26 @@ class BleBridge:
         Merges into _seen dict for cross-cycle dedup. Clears _seen every
         SEEN_RESET_CYCLES drains to age out disappeared devices.
         """
-        # Atomically swap raw_results (IRQ appends are non-preemptive)
-        raw = self._raw_results
-        self._raw_results = []
+        # Atomically swap buffers (IRQ callbacks are non-preemptive)
+        raw = self._scan_buf
+        self._scan_buf = self._spare_buf
+        self._spare_buf = raw
         self._cap_logged = False
         self._oom_logged = False
 
-        for addr_bytes, addr_type, rssi, adv_raw in raw:
-            entry = _parse_raw_entry(addr_bytes, addr_type, rssi, adv_raw)
-            _merge_entry(self._seen, entry)
+        if raw is not None:
+            for addr_bytes, addr_type, rssi, adv_raw in raw.entries():
+                _merge_entry(self._seen, _parse_adv(addr_type, rssi, adv_raw), addr_bytes)
+            raw.clear()
 
         self._seen_cycle += 1
         if self._seen_cycle >= board.SEEN_RESET_CYCLES:
             self._seen_cycle = 0
-            results = [
-                v
-                for v in self._seen.values()
-                if v["name"]
-                or v.get("manufacturer_data")
-                or v.get("services")
-                or v.get("service_data")
-            ]
+            results = _collect_results(self._seen)
             self._seen = {}
             return results
 
-        return [
-            v
-            for v in self._seen.values()
-            if v["name"]
-            or v.get("manufacturer_data")
-            or v.get("services")
-            or v.get("service_data")
-        ]
+        return _collect_results(self._seen)
 
     def stop_streaming(self):
         """Stop the indefinite BLE scan."""
@@ -422,7 +602,8 @@ class BleBridge:
             except Exception:
                 pass
             self._streaming = False
-            self._raw_results = []
+            self._scan_buf = None
+            self._spare_buf = None
             print("Streaming scan stopped")
 
     async def connect(self, address, addr_type=0):
@@ -444,7 +625,7 @@ class BleBridge:
             _ble.irq(_aioble_core.ble_irq)
         except Exception as e:  # noqa: BLE001
             print("Warning: could not restore aioble IRQ before connect: %s" % e)
-        addr_bytes = bytes(int(b, 16) for b in address.split(":"))
+        addr_bytes = binascii.unhexlify(address.replace(":", ""))
         # Two gc.collect() passes before connecting (#139). Under MICROPY_GC_SPLIT_HEAP_AUTO
         # a MicroPython split is returned to the ESP-IDF heap only when it becomes fully
         # empty during a pass, so gc.collect() cannot hand kilobytes back to the IDF heap
@@ -627,19 +808,20 @@ class BleBridge:
         # notify rather than indicate, which holds for every registry scale.
         prefer_indicate = can_indicate and not can_notify
 
+        # Wait without timeout_ms: aioble's DeviceTimeout spawns a sleeper task
+        # for every timed wait, i.e. one extra task per notification on a
+        # streaming scale. With no timeout an idle wait cannot expire, so a
+        # final result frame that lags the live stream is never dropped (#248).
+        # An untimed wait still wakes on disconnect, since aioble fails pending
+        # waiters with DeviceDisconnectedError, and the session guard (#296)
+        # covers a link that dies silently.
         async def _notify_loop():
             try:
                 while self._conn and self._conn.is_connected():
-                    try:
-                        if prefer_indicate:
-                            data = await char.indicated(timeout_ms=10000)
-                        else:
-                            data = await char.notified(timeout_ms=10000)
-                    except asyncio.TimeoutError:
-                        # No data in the 10s window but the link is still up
-                        # (the final result frame can lag the live stream).
-                        # Re-arm instead of killing the reader for good (#248).
-                        continue
+                    if prefer_indicate:
+                        data = await char.indicated()
+                    else:
+                        data = await char.notified()
                     if data:
                         await publish_fn(uuid_str, bytes(data))
             except asyncio.CancelledError:
@@ -10,6 +10,7 @@ import asyncio
 import gc
 import time
 import board
+from collections import deque
 from mqtt_as import MQTTClient, config as mqtt_config
 from ble_bridge import BleBridge
 
@@ -52,11 +53,21 @@ _gatt_session_armed = False
 _host_engaged = False
 _last_host_activity = 0
 
+# Full GC after every scan drain only on no-PSRAM boards; on PSRAM boards it
+# just stalls the loop (and LVGL frame pacing) for tens of ms.
+_AGGRESSIVE_GC = getattr(board, "AGGRESSIVE_GC", True)
+
 # Set True after on_connect finishes re-subscribing (avoids race with isconnected)
 _subs_ready = False
 
-# Pending commands set by the sync callback, processed in the async main loop
-_pending = []
+# Pending commands set by the sync callback, processed in the async main loop.
+# A deque gives O(1) popleft() where list.pop(0) shifted every queued command.
+# A full deque silently evicts its oldest entry, so on_message() refuses (and
+# logs) host commands one short of the bound: nothing queued is ever evicted,
+# and the last slot stays free for the unexpected-disconnect sentinel, which
+# fires at most once per connection.
+_PENDING_MAX = 32
+_pending = deque((), _PENDING_MAX)
 
 # Scale MAC detection for instant beep
 _scale_macs = set()
@@ -78,6 +89,29 @@ def topic(suffix):
     return f"{BASE}/{suffix}"
 
 
+# Topics matched or published per message, built once instead of re-formatted
+# on every dispatch.
+_T_CONFIG = topic("config")
+_T_CONNECT = topic("connect")
+_T_DISCONNECT = topic("disconnect")
+_T_BEEP = topic("beep")
+_T_DISPLAY_READING = topic("display/reading")
+_T_DISPLAY_RESULT = topic("display/result")
+_T_SCREENSHOT = topic("screenshot")
+_T_STATUS = topic("status")
+_T_ERROR = topic("error")
+_T_CONNECTED = topic("connected")
+_T_DISCONNECTED = topic("disconnected")
+_T_SCAN_RESULTS = topic("scan/results")
+
+# Every command topic is BASE/<cmd>[/<arg>]; the main loop slices off this
+# prefix once and dispatches on the short suffix.
+_BASE_LEN = len(BASE) + 1
+_CMD_SUBSCRIBE = "subscribe/"
+_CMD_WRITE = "write/"
+_CMD_READ = "read/"
+
+
 # ─── MQTT config ──────────────────────────────────────────────────────────────
 
 mqtt_config["ssid"] = cfg["wifi_ssid"]
@@ -86,7 +120,7 @@ mqtt_config["wifi_pw"] = cfg["wifi_password"]
 mqtt_config["server"] = cfg["mqtt_broker"]
 mqtt_config["port"] = cfg["mqtt_port"]
 mqtt_config["client_id"] = DEVICE_ID
-mqtt_config["will"] = (topic("status"), "offline", True, 1)
+mqtt_config["will"] = (_T_STATUS, "offline", True, 1)
 # 60s keepalive (broker tolerates ~90s without a ping): a GATT connect
 # attempt can starve WiFi for tens of seconds on the shared 2.4GHz radio,
 # so a tighter value drops the MQTT link mid-connect (#201).
@@ -99,7 +133,7 @@ def on_message(topic_bytes, msg, retained):
     """Sync callback — queue the command for async processing."""
     global _scale_macs, _auto_connect, _lazy_notify, _last_host_activity, _host_engaged
     t = topic_bytes.decode() if isinstance(topic_bytes, (bytes, bytearray)) else topic_bytes
-    if t == topic("config"):
+    if t == _T_CONFIG:
         try:
             data = json.loads(msg)
             _scale_macs = set(data.get("scales", []))
@@ -116,21 +150,29 @@ def on_message(topic_bytes, msg, retained):
     _last_host_activity = time.ticks_ms()
     if _gatt_session_armed:
         _host_engaged = True
+    if len(_pending) >= _PENDING_MAX - 1:
+        print(f"Command queue full, dropping {t}")
+        return
     _pending.append((t, msg))
 
 
+def _on_ble_disconnect():
+    """Bridge callback — queue the unexpected-disconnect sentinel."""
+    _pending.append(("__ble_disconnected__", b""))
+
+
 async def on_connect(client_ref):
     """Re-subscribe to command topics after every (re)connect."""
     global _char_subscribed, _subs_ready
     _subs_ready = False
-    await client_ref.subscribe(topic("connect"), 0)
-    await client_ref.subscribe(topic("disconnect"), 0)
-    await client_ref.subscribe(topic("config"), 0)
-    await client_ref.subscribe(topic("beep"), 0)
+    await client_ref.subscribe(_T_CONNECT, 0)
+    await client_ref.subscribe(_T_DISCONNECT, 0)
+    await client_ref.subscribe(_T_CONFIG, 0)
+    await client_ref.subscribe(_T_BEEP, 0)
     if board.HAS_DISPLAY:
-        await client_ref.subscribe(topic("display/reading"), 0)
-        await client_ref.subscribe(topic("display/result"), 0)
-        await client_ref.subscribe(topic("screenshot"), 0)
+        await client_ref.subscribe(_T_DISPLAY_READING, 0)
+        await client_ref.subscribe(_T_DISPLAY_RESULT, 0)
+        await client_ref.subscribe(_T_SCREENSHOT, 0)
     # Re-subscribe write/read wildcards if a BLE device is connected
     if _char_subscribed:
         await client_ref.subscribe(topic("write/#"), 0)
@@ -143,7 +185,7 @@ async def on_connect(client_ref):
     _subs_ready = True
     if board.HAS_DISPLAY:
         ui.on_mqtt_change(True)
-    await client_ref.publish(topic("status"), "online", retain=True, qos=1)
+    await client_ref.publish(_T_STATUS, "online", retain=True, qos=1)
     print(f"BLE-MQTT bridge ready: {BASE}")
 
 
@@ -161,7 +203,7 @@ client = MQTTClient(mqtt_config)
 async def publish_error(message):
     """Publish an error message so the host doesn't hang waiting for a response."""
     try:
-        await client.publish(topic("error"), message, qos=0)
+        await client.publish(_T_ERROR, message, qos=0)
     except Exception:
         pass
 
@@ -188,6 +230,44 @@ async def _wait_not_busy(max_iters=60, sleep_ms=500):
 
 # ─── Autonomous scan loop ────────────────────────────────────────────────────
 
+# Typical serialized size of one scan result, used to pre-size the publish
+# buffer so it rarely has to grow. An advert with ~25 bytes of manufacturer
+# data (Apple, Microsoft beacons) already serializes to ~190 bytes.
+_SCAN_JSON_EST = 224
+
+
+def _encode_scan_results(results):
+    """Serialize scan results to a JSON array in one pre-sized bytearray.
+
+    json.dumps(results) builds the whole array as a single growing string right
+    after the scan has fragmented the heap; a 500-device scan can be tens of KB.
+    Encoding one device at a time into a buffer sized up front keeps the peak
+    at the final payload plus one device. If the estimate falls short, the
+    buffer grows by the actual shortfall plus an estimate for the devices still
+    to come, never by doubling. Returns a memoryview of the filled part, which
+    mqtt_as publishes like bytes.
+    """
+    remaining = len(results)
+    buf = bytearray(remaining * _SCAN_JSON_EST + 2)
+    buf[0] = 0x5B  # "["
+    pos = 1
+    for r in results:
+        remaining -= 1
+        part = json.dumps(r).encode()
+        sep = 2 if pos > 1 else 0
+        end = pos + sep + len(part)
+        if end + 1 > len(buf):  # +1 keeps room for the closing "]"
+            grown = bytearray(end + 1 + remaining * _SCAN_JSON_EST)
+            grown[:pos] = memoryview(buf)[:pos]
+            buf = grown
+        if sep:
+            buf[pos:pos + 2] = b", "
+        buf[pos + sep:end] = part
+        pos = end
+    buf[pos] = 0x5D  # "]"
+    return memoryview(buf)[:pos + 1]
+
+
 def _check_scale_beep(results):
     """Beep/display if a known scale MAC is present (60s debounce)."""
     global _last_beep_time
@@ -203,28 +283,6 @@ def _check_scale_beep(results):
                 break
 
 
-def _find_scale_in_raw(raw_results):
-    """Find the first known scale MAC in the raw IRQ buffer.
-
-    Returns (mac, addr_bytes, addr_type) or None. Non-destructive peek used by the
-    autonomous connect logic to skip the MQTT round-trip (#201).
-
-    The controller-reported addr_type (the advertising PDU TxAdd bit) is
-    authoritative and is passed through unchanged. An earlier build forced
-    addr_type=1 whenever addr[0] & 0xC0 == 0xC0 on the theory that an FF address
-    must be random static, but a public address may use any bytes and cheap scale
-    SoCs advertise arbitrary public addresses that also start with 0xFF, so that
-    override connected the QN-Scale as random and it never matched the public
-    advertiser (#231).
-    """
-    for addr_bytes, addr_type, _rssi, _raw in raw_results:
-        mac = ":".join("%02X" % b for b in addr_bytes)
-        if mac in _scale_macs:
-            print(f"Auto-connect: found known scale {mac} in raw buffer (addr_type={addr_type})")
-            return mac, addr_bytes, addr_type
-    return None
-
-
 async def _gatt_session_guard():
     """End a GATT session the host never finishes, so scanning resumes (#296).
 
@@ -328,12 +386,12 @@ async def _auto_gatt_connect(mac, addr_type):
                     await bridge.start_notify(uuid_str, make_publish_fn(uuid_str))
                     print(f"Auto-connect: notify enabled for {uuid_str}")
 
-        bridge.set_on_disconnect(lambda: _pending.append(("__ble_disconnected__", b"")))
+        bridge.set_on_disconnect(_on_ble_disconnect)
 
         # Mark the response as autonomous so the host can distinguish it
         result["autonomous"] = True
         result["address"] = mac
-        await client.publish(topic("connected"), json.dumps(result), qos=0)
+        await client.publish(_T_CONNECTED, json.dumps(result), qos=0)
         _arm_session_guard()
         print(f"Auto-connect to {mac} succeeded, {len(result['chars'])} chars published to host")
     except Exception as e:
@@ -387,10 +445,10 @@ async def _streaming_scan_loop():
                 # Autonomous connect: ESP32 connects itself immediately,
                 # eliminating the MQTT round-trip (#201).
                 if _auto_connect:
-                    found = _find_scale_in_raw(bridge._raw_results)
+                    found = bridge.find_pending_scale(_scale_macs)
                     if found:
                         mac, _addr_bytes, addr_type = found
-                        print(f"Auto-connect: scale {mac} detected after {waited}ms, connecting immediately")
+                        print(f"Auto-connect: scale {mac} (addr_type={addr_type}) detected after {waited}ms, connecting immediately")
                         # A stepped-on GATT-only scale stays connectable only
                         # briefly, so reach gap_connect with minimal delay (#231).
                         # Snapshot scan results synchronously before stop_streaming
@@ -404,7 +462,7 @@ async def _streaming_scan_loop():
                             results = []
                         await _auto_gatt_connect(mac, addr_type)
                         try:
-                            await client.publish(topic("scan/results"), json.dumps(results), qos=0)
+                            await client.publish(_T_SCAN_RESULTS, _encode_scan_results(results), qos=0)
                         except Exception:
                             pass
                         break
@@ -417,13 +475,14 @@ async def _streaming_scan_loop():
 
         try:
             results = bridge.drain_results()
-            gc.collect()
+            if _AGGRESSIVE_GC:
+                gc.collect()
             print(f"Streaming scan: {len(results)} devices (free: {gc.mem_free()})")
             if board.HAS_DISPLAY:
                 ui.on_scan_tick(len(results))
             _check_scale_beep(results)
             board.on_scan_complete(results, bool(_scale_macs))
-            await client.publish(topic("scan/results"), json.dumps(results), qos=0)
+            await client.publish(_T_SCAN_RESULTS, _encode_scan_results(results), qos=0)
             if board.HAS_DISPLAY:
                 ui.on_publish_tick()
         except Exception as e:
@@ -459,13 +518,13 @@ async def _batch_scan_loop():
 
         _busy = True
         try:
-            gc.collect()
+            # bridge.scan() collects before and after the scan on
+            # AGGRESSIVE_GC boards, so the loop does not repeat it.
             print(f"Scanning... (free: {gc.mem_free()})")
             # On shared-radio boards, BLE disrupts WiFi — mark subs stale
             if board.DEACTIVATE_BLE_AFTER_SCAN:
                 _subs_ready = False
             results = await bridge.scan()
-            gc.collect()
             print(f"Scan done: {len(results)} devices (free: {gc.mem_free()})")
             if board.HAS_DISPLAY:
                 ui.on_scan_tick(len(results))
@@ -481,7 +540,7 @@ async def _batch_scan_loop():
                         break
                     await asyncio.sleep(1)
             board.on_scan_complete(results, bool(_scale_macs))
-            await client.publish(topic("scan/results"), json.dumps(results), qos=0)
+            await client.publish(_T_SCAN_RESULTS, _encode_scan_results(results), qos=0)
             print("Results published")
             if board.HAS_DISPLAY:
                 ui.on_publish_tick()
@@ -518,8 +577,10 @@ async def scan_loop():
 
 def make_publish_fn(u):
     """Forward notifications from char `u` to notify/<u> (qos 0), as today."""
+    t = topic(f"notify/{u}")
+
     async def publish_fn(_source_uuid, data):
-        await client.publish(topic(f"notify/{u}"), data, qos=0)
+        await client.publish(t, data, qos=0)
     return publish_fn
 
 
@@ -572,8 +633,8 @@ async def handle_connect(payload):
                     uuid_str = char_info["uuid"]
                     await bridge.start_notify(uuid_str, make_publish_fn(uuid_str))
 
-        bridge.set_on_disconnect(lambda: _pending.append(("__ble_disconnected__", b"")))
-        await client.publish(topic("connected"), json.dumps(result), qos=0)
+        bridge.set_on_disconnect(_on_ble_disconnect)
+        await client.publish(_T_CONNECTED, json.dumps(result), qos=0)
         _arm_session_guard()
     except Exception as e:
         _resume_scanning()  # Resume scanning on connect failure
@@ -588,7 +649,7 @@ async def handle_disconnect():
     await bridge.disconnect()
     _char_subscribed = False
     _resume_scanning()  # Resume autonomous scanning
-    await client.publish(topic("disconnected"), "", qos=0)
+    await client.publish(_T_DISCONNECTED, "", qos=0)
 
 
 async def handle_unexpected_disconnect():
@@ -598,7 +659,7 @@ async def handle_unexpected_disconnect():
     await bridge.disconnect()
     _char_subscribed = False
     _resume_scanning()
-    await client.publish(topic("disconnected"), "", qos=0)
+    await client.publish(_T_DISCONNECTED, "", qos=0)
 
 
 async def handle_write(uuid_str, payload):
@@ -651,22 +712,24 @@ async def main():
 
     while True:
         while _pending:
-            t, msg = _pending.pop(0)
+            t, msg = _pending.popleft()
             try:
                 if t == "__ble_disconnected__":
                     await handle_unexpected_disconnect()
-                elif t == topic("connect"):
+                    continue
+                cmd = t[_BASE_LEN:]
+                if cmd == "connect":
                     await handle_connect(msg)
-                elif t == topic("disconnect"):
+                elif cmd == "disconnect":
                     await handle_disconnect()
-                elif t == topic("beep"):
+                elif cmd == "beep":
                     if board.HAS_BEEP:
                         if msg:
                             d = json.loads(msg)
                             beep(d.get("freq", 1000), d.get("duration", 200), d.get("repeat", 1))
                         else:
                             beep()
-                elif t == topic("display/reading"):
+                elif cmd == "display/reading":
                     if board.HAS_DISPLAY:
                         d = json.loads(msg)
                         ui.on_reading(
@@ -676,7 +739,7 @@ async def main():
                             d.get("impedance"),
                             d.get("exporters", []),
                         )
-                elif t == topic("display/result"):
+                elif cmd == "display/result":
                     if board.HAS_DISPLAY:
                         d = json.loads(msg)
                         ui.on_result(
@@ -685,7 +748,7 @@ async def main():
                             d.get("weight", 0),
                             d.get("exports", []),
                         )
-                elif t == topic("screenshot"):
+                elif cmd == "screenshot":
                     if board.HAS_DISPLAY:
                         try:
                             # Read directly from DMA framebuffer (not LVGL snapshot)
@@ -712,16 +775,14 @@ async def main():
                         except Exception as e:
                             import sys
                             sys.print_exception(e)
-                elif t.startswith(topic("subscribe/")):
-                    uuid_str = t[len(topic("subscribe/")):]
-                    await handle_subscribe(uuid_str)
-                elif t.startswith(topic("write/")):
-                    uuid_str = t[len(topic("write/")):]
-                    await handle_write(uuid_str, msg)
-                elif t.startswith(topic("read/")):
-                    suffix = t[len(topic("read/")):]
-                    if "/response" not in suffix:
-                        await handle_read(suffix)
+                elif cmd.startswith(_CMD_SUBSCRIBE):
+                    await handle_subscribe(cmd[len(_CMD_SUBSCRIBE):])
+                elif cmd.startswith(_CMD_WRITE):
+                    await handle_write(cmd[len(_CMD_WRITE):], msg)
+                elif cmd.startswith(_CMD_READ):
+                    uuid_str = cmd[len(_CMD_READ):]
+                    if "/response" not in uuid_str:
+                        await handle_read(uuid_str)
             except Exception as e:
                 import sys
 
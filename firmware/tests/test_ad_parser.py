@@ -21,11 +21,17 @@ if _FIRMWARE_DIR not in sys.path:
 # - aioble: referenced only at runtime in connect()/disconnect()
 # - bluetooth: ble_bridge calls bluetooth.BLE() at import time
 # - board: ble_bridge `import board` resolves attributes lazily
+# - micropython: @micropython.native is a no-op decorator on the host
 sys.modules["aioble"] = types.ModuleType("aioble")
 _bt = types.ModuleType("bluetooth")
 _bt.BLE = lambda: None
 sys.modules["bluetooth"] = _bt
 sys.modules["board"] = types.ModuleType("board")
+if "micropython" not in sys.modules:
+    _mp = types.ModuleType("micropython")
+    _mp.viper = lambda f: f
+    _mp.native = lambda f: f
+    sys.modules["micropython"] = _mp
 
 import ble_bridge  # noqa: E402
 
@@ -181,6 +187,40 @@ class TestParseRawEntry(unittest.TestCase):
         self.assertEqual(entry["name"], "")
         self.assertNotIn("manufacturer_id", entry)
 
+    def test_invalid_utf8_name_is_empty(self):
+        entry = _parse(_ad(0x09, b"\xff\xfe"))
+        self.assertEqual(entry["name"], "")
+
+
+# ─── _parse_ad ───────────────────────────────────────────────────────────────
+
+
+class TestParseAd(unittest.TestCase):
+    def test_returns_raw_payloads(self):
+        raw = (
+            _ad(0x09, b"ES-CS20M")
+            + _ad(0x16, bytes([0x6F, 0xFD, 0xCA, 0xFE]))
+            + _ad(0xFF, bytes([0x4C, 0x00, 0x01, 0x02]))
+        )
+        name, services, service_data, mfr_id, mfr_payload = ble_bridge._parse_ad(raw)
+        self.assertEqual(name, b"ES-CS20M")
+        self.assertEqual(services, [])
+        self.assertEqual(service_data, [("fd6f", b"\xca\xfe")])
+        self.assertEqual(mfr_id, 0x004C)
+        self.assertEqual(mfr_payload, b"\x01\x02")
+
+    def test_memoryview_input_matches_bytes(self):
+        raw = (
+            _ad(0x09, b"ES-CS20M")
+            + _ad(0x07, _UUID_1A10_LE)
+            + _ad(0x21, _UUID_1A10_LE + bytes([0xAA]))
+        )
+        entry = ble_bridge._parse_raw_entry(_MAC, 0, -50, memoryview(raw))
+        self.assertEqual(entry, _parse(raw))
+
+    def test_empty_advert(self):
+        self.assertEqual(ble_bridge._parse_ad(b""), (None, [], [], None, None))
+
 
 # ─── _merge_entry ────────────────────────────────────────────────────────────
 
@@ -286,6 +326,29 @@ class TestMergeEntry(unittest.TestCase):
         )
 
 
+class TestCollectResults(unittest.TestCase):
+    """Scan dedup keyed by raw address bytes, MAC formatted only on output."""
+
+    _NAME_ADV = b"\x03\x09ab"  # Complete Local Name "ab"
+
+    def test_merge_by_address_bytes(self):
+        seen = {}
+        ble_bridge._merge_entry(seen, ble_bridge._parse_adv(0, -80, b""), _MAC)
+        ble_bridge._merge_entry(seen, ble_bridge._parse_adv(0, -60, self._NAME_ADV), _MAC)
+        self.assertEqual(list(seen), [_MAC])
+        self.assertEqual(seen[_MAC]["rssi"], -60)
+        self.assertEqual(seen[_MAC]["name"], "ab")
+
+    def test_only_survivors_get_an_address(self):
+        other = b"\x11\x22\x33\x44\x55\x66"
+        seen = {}
+        ble_bridge._merge_entry(seen, ble_bridge._parse_adv(0, -50, self._NAME_ADV), _MAC)
+        ble_bridge._merge_entry(seen, ble_bridge._parse_adv(0, -50, b""), other)
+        results = ble_bridge._collect_results(seen)
+        self.assertEqual([r["address"] for r in results], [_MAC_STR])
+        self.assertNotIn("address", seen[other])
+
+
 class TestRawHasMac(unittest.TestCase):
     """_raw_has_mac: non-destructive peek of the streaming IRQ buffer (#201)."""
 
@@ -314,6 +377,178 @@ class TestRawHasMac(unittest.TestCase):
         # must therefore not match.
         self.assertFalse(ble_bridge._raw_has_mac([self._raw(_MAC)], {_MAC_STR.lower()}))
 
+    def test_walks_only_first_n_slots(self):
+        slots = [self._raw(b"\x11\x22\x33\x44\x55\x66"), self._raw(_MAC), None]
+        self.assertFalse(ble_bridge._raw_has_mac(slots, {_MAC_STR}, 1))
+        self.assertTrue(ble_bridge._raw_has_mac(slots, {_MAC_STR}, 2))
+
+
+class TestFindRawMac(unittest.TestCase):
+    """_find_raw_mac: first known scale MAC in the raw buffer, addr_type
+    passed through unchanged. The FF scale advertises as public and must
+    connect as public; the earlier random-forcing override was the #231 bug."""
+
+    _FF_MAC = b"\xFF\x03\x00\x53\xD6\x4D"
+    _FF_MAC_STR = "FF:03:00:53:D6:4D"
+    _OTHER_MAC = b"\xAA\xBB\xCC\xDD\xEE\xFF"
+    _MACS = {_FF_MAC_STR, _MAC_STR}
+
+    @staticmethod
+    def _raw(addr_bytes, addr_type=0):
+        return (addr_bytes, addr_type, -50, b"")
+
+    def test_empty_buffer(self):
+        self.assertIsNone(ble_bridge._find_raw_mac([], self._MACS))
+
+    def test_no_known_mac(self):
+        raw = [self._raw(self._OTHER_MAC)]
+        self.assertIsNone(ble_bridge._find_raw_mac(raw, self._MACS))
+
+    def test_empty_mac_set(self):
+        self.assertIsNone(ble_bridge._find_raw_mac([self._raw(self._FF_MAC)], set()))
+
+    def test_known_mac_found(self):
+        raw = [self._raw(self._OTHER_MAC), self._raw(self._FF_MAC, addr_type=1)]
+        self.assertEqual(
+            ble_bridge._find_raw_mac(raw, self._MACS),
+            (self._FF_MAC_STR, self._FF_MAC, 1),
+        )
+
+    def test_returns_first_match(self):
+        # Both entries are the same FF MAC. The first match is returned, and its
+        # controller-reported addr_type is passed through unchanged (#231).
+        raw = [self._raw(self._FF_MAC, addr_type=0), self._raw(self._FF_MAC, addr_type=1)]
+        self.assertEqual(
+            ble_bridge._find_raw_mac(raw, self._MACS),
+            (self._FF_MAC_STR, self._FF_MAC, 0),
+        )
+
+    def test_reported_addr_type_trusted(self):
+        # FF starts with 0xFF, but the controller reports it public (TxAdd=0) and
+        # the host-initiated path connects it as public successfully, so the
+        # reported type must win for FF and public-OUI addresses alike.
+        for addr in (self._FF_MAC, _MAC):
+            for addr_type in (0, 1):
+                found = ble_bridge._find_raw_mac([self._raw(addr, addr_type)], self._MACS)
+                self.assertEqual(found[2], addr_type)
+
+    def test_walks_only_first_n_slots(self):
+        slots = [self._raw(self._OTHER_MAC), self._raw(self._FF_MAC), None]
+        self.assertIsNone(ble_bridge._find_raw_mac(slots, self._MACS, 1))
+        self.assertEqual(ble_bridge._find_raw_mac(slots, self._MACS, 2)[0], self._FF_MAC_STR)
+
+
+class TestFormatMac(unittest.TestCase):
+    """_format_mac: hexlify with separator, and the fallback join."""
+
+    def test_separator_path(self):
+        self.assertTrue(ble_bridge._HEX_SEP)
+        self.assertEqual(ble_bridge._format_mac(_MAC), _MAC_STR)
+
+    def test_fallback_without_separator(self):
+        orig = ble_bridge._HEX_SEP
+        ble_bridge._HEX_SEP = False
+        try:
+            self.assertEqual(ble_bridge._format_mac(_MAC), _MAC_STR)
+        finally:
+            ble_bridge._HEX_SEP = orig
+
+
+class TestRawScanBuffer(unittest.TestCase):
+    """Preallocated IRQ buffer and the streaming drain swap."""
+
+    def test_entries_and_clear(self):
+        buf = ble_bridge._RawScanBuffer(3)
+        self.assertEqual(buf.slots, [None, None, None])
+        buf.slots[0] = (_MAC, 0, -50, b"")
+        buf.n = 1
+        self.assertEqual(buf.entries(), [(_MAC, 0, -50, b"")])
+        buf.clear()
+        self.assertEqual(buf.n, 0)
+        self.assertEqual(buf.slots, [None, None, None])
+
+    def test_add_copies_payload_into_pool(self):
+        buf = ble_bridge._RawScanBuffer(2)
+        adv = bytearray(_ad(0x09, b"scale"))
+        buf.add(memoryview(_MAC), 1, -40, memoryview(adv))
+        adv[2] = 0  # the IRQ's adv_data buffer is reused by the stack
+        addr, addr_type, rssi, stored = buf.entries()[0]
+        self.assertEqual((addr, addr_type, rssi), (_MAC, 1, -40))
+        self.assertEqual(bytes(stored), _ad(0x09, b"scale"))
+
+    def test_add_oversized_payload_falls_back_to_copy(self):
+        buf = ble_bridge._RawScanBuffer(1)
+        adv = bytes(40)
+        buf.add(_MAC, 0, -40, adv)
+        self.assertEqual(buf.entries()[0][3], adv)
+
+    def test_drain_swaps_buffers(self):
+        ble_bridge.board.SEEN_RESET_CYCLES = 5
+        bridge = ble_bridge.BleBridge()
+        filled = ble_bridge._RawScanBuffer(4)
+        spare = ble_bridge._RawScanBuffer(4)
+        filled.add(_MAC, 0, -50, _ad(0x09, b"scale"))
+        bridge._scan_buf, bridge._spare_buf = filled, spare
+
+        results = bridge.drain_results()
+
+        self.assertEqual([r["address"] for r in results], [_MAC_STR])
+        self.assertIs(bridge._scan_buf, spare)
+        self.assertIs(bridge._spare_buf, filled)
+        self.assertEqual(filled.n, 0)
+        self.assertEqual(spare.n, 0)
+
+    def test_pending_scale_mac_reads_streaming_buffer(self):
+        bridge = ble_bridge.BleBridge()
+        self.assertFalse(bridge.has_pending_scale_mac({_MAC_STR}))
+        bridge._scan_buf = ble_bridge._RawScanBuffer(4)
+        self.assertFalse(bridge.has_pending_scale_mac({_MAC_STR}))
+        bridge._scan_buf.add(_MAC, 0, -50, b"")
+        self.assertTrue(bridge.has_pending_scale_mac({_MAC_STR}))
+
+    def test_find_pending_scale_walks_streaming_buffer(self):
+        bridge = ble_bridge.BleBridge()
+        self.assertIsNone(bridge.find_pending_scale({_MAC_STR}))
+        bridge._scan_buf = ble_bridge._RawScanBuffer(4)
+        bridge._scan_buf.add(b"\x11\x22\x33\x44\x55\x66", 0, -50, b"")
+        self.assertIsNone(bridge.find_pending_scale({_MAC_STR}))
+        bridge._scan_buf.add(_MAC, 1, -50, b"")
+        self.assertEqual(bridge.find_pending_scale({_MAC_STR}), (_MAC_STR, _MAC, 1))
+
+
+class _BufferUUID:
+    """Stands in for bluetooth.UUID: raw little-endian value via bytes()."""
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    def __bytes__(self):
+        return self._raw
+
+
+class TestNormUuid(unittest.TestCase):
+    def test_16bit_uuid_expanded(self):
+        self.assertEqual(
+            ble_bridge._norm_uuid(_BufferUUID(b"\x9d\x2a")),
+            "00002a9d" + ble_bridge._BT_BASE_SUFFIX,
+        )
+
+    def test_32bit_uuid_expanded(self):
+        self.assertEqual(
+            ble_bridge._norm_uuid(_BufferUUID(bytes([0x78, 0x56, 0x34, 0x12]))),
+            "12345678" + ble_bridge._BT_BASE_SUFFIX,
+        )
+
+    def test_128bit_uuid_reversed(self):
+        self.assertEqual(ble_bridge._norm_uuid(_BufferUUID(_UUID_1A10_LE)), _UUID_1A10_FULL)
+
+    def test_string_forms_still_normalized(self):
+        self.assertEqual(ble_bridge._norm_uuid("UUID(0x2A9D)"), "00002a9d" + ble_bridge._BT_BASE_SUFFIX)
+        self.assertEqual(
+            ble_bridge._norm_uuid("0000FFF1-0000-1000-8000-00805F9B34FB"),
+            "0000fff100001000800000805f9b34fb",
+        )
+
 
 class TestUnpackScanResult(unittest.TestCase):
     """_unpack_scan_result: keep real addr_type, drop adv_type (#231)."""
@@ -1,9 +1,10 @@
 """Host-runnable tests for the autonomous GATT connect helpers in main.py.
 
-The _find_scale_in_raw function lives in main.py and uses the _scale_macs
-global. Because main.py has heavy import-time side effects (MQTT, WiFi,
-config.json), we test the logic by extracting and exercising the function
-directly from module globals.
+Also covers _encode_scan_results, the scan/results JSON encoder.
+
+Because main.py has heavy import-time side effects (MQTT, WiFi, config.json),
+we test the logic by exercising the helpers directly from module globals. The
+raw-buffer scale lookup lives on the bridge and is covered in test_ad_parser.
 
 Run: python -m unittest discover -s firmware/tests
 """
@@ -58,8 +59,8 @@ _ble_bridge.BleBridge = lambda: types.SimpleNamespace(
     start_streaming=lambda: None,
     stop_streaming=lambda: None,
     has_pending_scale_mac=lambda macs: False,
+    find_pending_scale=lambda macs: None,
     drain_results=lambda: [],
-    _raw_results=[],
 )
 sys.modules["ble_bridge"] = _ble_bridge
 
@@ -100,96 +101,6 @@ if not hasattr(_asyncio, "sleep_ms"):
     _asyncio.sleep_ms = lambda ms: _asyncio.sleep(ms / 1000)
 
 
-# ─── helpers ─────────────────────────────────────────────────────────────────
-
-_MAC_BYTES = b"\xFF\x03\x00\x53\xD6\x4D"
-_MAC_STR = "FF:03:00:53:D6:4D"
-
-_OTHER_MAC_BYTES = b"\xAA\xBB\xCC\xDD\xEE\xFF"
-_OTHER_MAC_STR = "AA:BB:CC:DD:EE:FF"
-
-_PUBLIC_MAC_BYTES = b"\x84\xFC\xE6\x53\x06\x1C"
-_PUBLIC_MAC_STR = "84:FC:E6:53:06:1C"
-
-
-def _raw_entry(addr_bytes, addr_type=0, rssi=-50, adv_data=b""):
-    """Create a raw IRQ buffer tuple."""
-    return (addr_bytes, addr_type, rssi, adv_data)
-
-
-class TestFindScaleInRaw(unittest.TestCase):
-    """_find_scale_in_raw: find first known scale MAC in raw buffer."""
-
-    def setUp(self):
-        # Set known scale MACs
-        main._scale_macs = {_MAC_STR}
-
-    def tearDown(self):
-        main._scale_macs = set()
-
-    def test_empty_buffer(self):
-        self.assertIsNone(main._find_scale_in_raw([]))
-
-    def test_no_known_mac(self):
-        raw = [_raw_entry(_OTHER_MAC_BYTES)]
-        self.assertIsNone(main._find_scale_in_raw(raw))
-
-    def test_known_mac_found(self):
-        raw = [_raw_entry(_OTHER_MAC_BYTES), _raw_entry(_MAC_BYTES, addr_type=1)]
-        result = main._find_scale_in_raw(raw)
-        self.assertIsNotNone(result)
-        mac, addr_bytes, addr_type = result
-        self.assertEqual(mac, _MAC_STR)
-        self.assertEqual(addr_bytes, _MAC_BYTES)
-        self.assertEqual(addr_type, 1)
-
-    def test_returns_first_match(self):
-        # Both entries are the same FF MAC. The first match is returned, and its
-        # controller-reported addr_type is passed through unchanged (#231).
-        raw = [_raw_entry(_MAC_BYTES, addr_type=0), _raw_entry(_MAC_BYTES, addr_type=1)]
-        result = main._find_scale_in_raw(raw)
-        self.assertIsNotNone(result)
-        self.assertEqual(result[0], _MAC_STR)
-        self.assertEqual(result[1], _MAC_BYTES)
-        self.assertEqual(result[2], 0)  # reported type trusted, no override
-
-    def test_empty_scale_macs(self):
-        main._scale_macs = set()
-        raw = [_raw_entry(_MAC_BYTES)]
-        self.assertIsNone(main._find_scale_in_raw(raw))
-
-
-class TestFindScaleTrustsScanAddrType(unittest.TestCase):
-    """_find_scale_in_raw passes the controller-reported addr_type through
-    unchanged. The FF scale advertises as public and must connect as public; the
-    earlier random-forcing override was the #231 bug."""
-
-    def setUp(self):
-        main._scale_macs = {_MAC_STR, _PUBLIC_MAC_STR}
-
-    def tearDown(self):
-        main._scale_macs = set()
-
-    def test_ff_mac_reported_public_stays_public(self):
-        # FF starts with 0xFF, but the controller reports it public (TxAdd=0) and
-        # the host-initiated path connects it as public successfully, so the
-        # reported type must win. Forcing random here was the bug (#231).
-        raw = [_raw_entry(_MAC_BYTES, addr_type=0)]
-        self.assertEqual(main._find_scale_in_raw(raw)[2], 0)
-
-    def test_ff_mac_reported_random_stays_random(self):
-        raw = [_raw_entry(_MAC_BYTES, addr_type=1)]
-        self.assertEqual(main._find_scale_in_raw(raw)[2], 1)
-
-    def test_public_oui_mac_reported_public_stays_public(self):
-        raw = [_raw_entry(_PUBLIC_MAC_BYTES, addr_type=0)]
-        self.assertEqual(main._find_scale_in_raw(raw)[2], 0)
-
-    def test_public_oui_mac_reported_random_stays_random(self):
-        raw = [_raw_entry(_PUBLIC_MAC_BYTES, addr_type=1)]
-        self.assertEqual(main._find_scale_in_raw(raw)[2], 1)
-
-
 class TestAutoConnectConfig(unittest.TestCase):
     """_auto_connect flag parsing from config topic."""
 
@@ -435,5 +346,50 @@ class TestWaitNotBusy(unittest.IsolatedAsyncioTestCase):
             await task
 
 
+def _device(n, **extra):
+    d = {
+        "address": "AA:BB:CC:DD:EE:%02X" % n,
+        "name": "dev\u00e9\"%d" % n,
+        "rssi": -40 - n,
+        "services": ["1a10"],
+        "addr_type": 0,
+    }
+    d.update(extra)
+    return d
+
+
+def _decode(view):
+    return json.loads(bytes(view).decode())
+
+
+class TestEncodeScanResults(unittest.TestCase):
+    """_encode_scan_results: per-device JSON into one pre-sized buffer."""
+
+    def test_empty_results(self):
+        self.assertEqual(bytes(main._encode_scan_results([])), b"[]")
+
+    def test_round_trips_like_json_dumps(self):
+        results = [
+            _device(1),
+            _device(2, manufacturer_id=0x004C, manufacturer_data="0102"),
+            _device(3, service_data=[{"uuid": "fd6f", "data": "cafe"}]),
+        ]
+        self.assertEqual(_decode(main._encode_scan_results(results)), results)
+
+    def test_typical_advert_fits_the_estimate(self):
+        apple = _device(1, manufacturer_id=0x004C, manufacturer_data="ab" * 25)
+        view = main._encode_scan_results([apple] * 10)
+        self.assertEqual(len(view.obj), 10 * main._SCAN_JSON_EST + 2)
+        self.assertEqual(_decode(view), [apple] * 10)
+
+    def test_grows_by_the_shortfall(self):
+        big = _device(1, name="x" * (main._SCAN_JSON_EST * 3))
+        results = [big, _device(2), big]
+        view = main._encode_scan_results(results)
+        self.assertEqual(_decode(view), results)
+        # The last growth sizes the buffer for what is left, not a doubling.
+        self.assertEqual(len(view.obj), len(view))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,139 @@
+"""Host-runnable tests for the I2S tone generator in beep.py.
+
+Runs under CPython by stubbing the board module and the viper code emitter
+(the decorator becomes a no-op, ptr16/ptr32 signed memoryviews); I2S is
+replaced with a fake that records written buffers. Covers the quarter-wave LUT synthesis against a
+float reference, the PCM tone cache and its byte-capped FIFO.
+
+Run: python -m unittest discover -s firmware/tests
+"""
+
+import builtins
+import math
+import os
+import struct
+import sys
+import types
+import unittest
+
+_FIRMWARE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _FIRMWARE_DIR not in sys.path:
+    sys.path.insert(0, _FIRMWARE_DIR)
+
+sys.modules.setdefault("board", types.ModuleType("board"))
+if "micropython" not in sys.modules:
+    _mp = types.ModuleType("micropython")
+    _mp.viper = lambda f: f
+    _mp.native = lambda f: f
+    sys.modules["micropython"] = _mp
+if not hasattr(builtins, "ptr16"):
+    builtins.ptr16 = lambda obj: memoryview(obj).cast("B").cast("h")
+if not hasattr(builtins, "ptr32"):
+    builtins.ptr32 = lambda obj: memoryview(obj).cast("B").cast("i")
+
+import beep  # noqa: E402
+
+
+class _FakeI2S:
+    def __init__(self):
+        self.writes = []
+
+    def write(self, buf):
+        self.writes.append(bytes(buf))
+
+
+def _reset_cache():
+    beep._tone_cache.clear()
+    del beep._tone_keys[:]
+    beep._tone_bytes = 0
+    beep._silence = None
+
+
+def _samples(buf):
+    """Decode a stereo 16-bit PCM buffer into (left, right) sample tuples."""
+    return [struct.unpack_from("<hh", buf, i) for i in range(0, len(buf), 4)]
+
+
+class TestGenerateTone(unittest.TestCase):
+    def test_matches_float_sine_within_lut_error(self):
+        for freq in (440, 1000, 2500):
+            frames = _samples(beep._generate_tone(freq, 20))
+            for i, (left, right) in enumerate(frames):
+                ref = 16000 * math.sin(2 * math.pi * freq * i / beep._SAMPLE_RATE)
+                self.assertEqual(left, right)
+                self.assertLess(abs(left - ref), 200, (freq, i))
+
+    def test_zero_frequency_is_silence(self):
+        buf = beep._generate_tone(0, 50)
+        self.assertEqual(bytes(buf), bytes(len(buf)))
+
+    def test_returns_buffer_of_requested_length(self):
+        buf = beep._generate_tone(500, 300)
+        self.assertIsInstance(buf, bytearray)
+        self.assertEqual(len(buf), 8000 * 300 // 1000 * 4)
+
+    def test_quadrant_peaks(self):
+        # 2 kHz at 8 kHz sample rate lands exactly on 0, +peak, 0, -peak.
+        frames = _samples(beep._generate_tone(2000, 1))
+        self.assertEqual([f[0] for f in frames[:4]], [0, 16000, 0, -16000])
+
+
+class TestToneCache(unittest.TestCase):
+    def setUp(self):
+        _reset_cache()
+        self._orig_board = beep.board
+        beep.board = types.SimpleNamespace(HAS_BEEP=True, BEEP_PINS=None)
+        self.i2s = _FakeI2S()
+        beep._i2s = self.i2s
+
+    def tearDown(self):
+        beep.board = self._orig_board
+        beep._i2s = None
+        _reset_cache()
+
+    def test_repeat_beep_reuses_cached_buffer(self):
+        first = beep._get_tone(1000, 200)
+        second = beep._get_tone(1000, 200)
+        self.assertIs(first, second)
+        self.assertEqual(len(first), 8000 * 200 // 1000 * 4)
+
+    def test_cache_is_capped_by_bytes_fifo(self):
+        size = len(beep._get_tone(100, 200))
+        fits = beep._TONE_CACHE_BYTES // size
+        for freq in range(101, 101 + fits):
+            beep._get_tone(freq, 200)
+        self.assertEqual(len(beep._tone_cache), fits)
+        self.assertLessEqual(beep._tone_bytes, beep._TONE_CACHE_BYTES)
+        self.assertEqual(beep._tone_bytes, fits * size)
+        self.assertNotIn((100, 200), beep._tone_cache)
+        self.assertIn((100 + fits, 200), beep._tone_cache)
+
+    def test_long_tone_is_not_cached(self):
+        tone = beep._get_tone(1000, 2000)
+        self.assertEqual(len(tone), 8000 * 2000 // 1000 * 4)
+        self.assertEqual(beep._tone_cache, {})
+        self.assertEqual(beep._tone_bytes, 0)
+
+    def test_beep_writes_tone_and_silence_between_repeats(self):
+        beep.beep(1000, 50, repeat=3)
+        tone = beep._get_tone(1000, 50)
+        self.assertEqual([w == tone for w in self.i2s.writes].count(True), 3)
+        self.assertEqual(self.i2s.writes[0], tone)
+        gap = self.i2s.writes[1:-1]
+        self.assertTrue(all(w == tone or not any(w) for w in gap))
+        silent = sum(len(w) for w in gap if w != tone)
+        self.assertEqual(silent, 2 * (8000 * beep._GAP_MS // 1000 * 4))
+
+    def test_single_beep_skips_silence(self):
+        beep.beep(1000, 50)
+        self.assertEqual(len(self.i2s.writes), 1)
+        self.assertIsNone(beep._silence)
+
+    def test_noop_without_speaker(self):
+        beep.board = types.SimpleNamespace(HAS_BEEP=False, BEEP_PINS=None)
+        beep.beep()
+        self.assertEqual(self.i2s.writes, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
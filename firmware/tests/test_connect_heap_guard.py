@@ -46,6 +46,11 @@ _board.CONNECT_TIMEOUT_MS = 15000
 _board.CONNECT_SCAN_MS = 15000
 _board.CONNECT_RETRIES = 1
 sys.modules["board"] = _board
+if "micropython" not in sys.modules:
+    _mp = types.ModuleType("micropython")
+    _mp.viper = lambda f: f
+    _mp.native = lambda f: f
+    sys.modules["micropython"] = _mp
 
 # test_auto_connect stubs sys.modules["ble_bridge"] with a SimpleNamespace; drop
 # it so the real firmware module imports under the stubs installed above.
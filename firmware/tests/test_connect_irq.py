@@ -107,12 +107,10 @@ class _SubscribableFakeChar:
     requires FLAG_NOTIFY and indicated() requires FLAG_INDICATE, else both raise
     ValueError("Unsupported") (#248). With *_data set, the matching read returns
     it once; otherwise it blocks until cancelled so subscribe-only tests can
-    assert without the loop racing ahead (#231)."""
+    assert without the loop racing ahead (#231). Records the timeout_ms each
+    read was called with."""
 
-    def __init__(
-        self, uuid, properties, indicate_data=None, notify_data=None,
-        timeouts_before_data=0,
-    ):
+    def __init__(self, uuid, properties, indicate_data=None, notify_data=None):
         self.uuid = uuid
         self.properties = properties
         self.subscribed = []  # list of (notify, indicate) tuples
@@ -120,23 +118,16 @@ class _SubscribableFakeChar:
         self.indicated_calls = 0
         self._indicate_data = indicate_data
         self._notify_data = notify_data
-        # Number of leading reads that raise asyncio.TimeoutError (10s idle)
-        # before data is delivered, mirroring aioble's DeviceTimeout (#248).
-        self._timeouts = timeouts_before_data
+        self.read_timeouts = []
 
     async def subscribe(self, notify=True, indicate=False):
         self.subscribed.append((notify, indicate))
 
-    def _maybe_timeout(self):
-        if self._timeouts > 0:
-            self._timeouts -= 1
-            raise asyncio.TimeoutError
-
     async def notified(self, timeout_ms=None):
         self.notified_calls += 1
+        self.read_timeouts.append(timeout_ms)
         if not (self.properties & _bt.FLAG_NOTIFY):
             raise ValueError("Unsupported")
-        self._maybe_timeout()
         if self._notify_data is not None:
             data, self._notify_data = self._notify_data, None
             return data
@@ -144,9 +135,9 @@ class _SubscribableFakeChar:
 
     async def indicated(self, timeout_ms=None):
         self.indicated_calls += 1
+        self.read_timeouts.append(timeout_ms)
         if not (self.properties & _bt.FLAG_INDICATE):
             raise ValueError("Unsupported")
-        self._maybe_timeout()
         if self._indicate_data is not None:
             data, self._indicate_data = self._indicate_data, None
             return data
@@ -255,6 +246,11 @@ _board.CONNECT_TIMEOUT_MS = 15000
 _board.CONNECT_SCAN_MS = 15000
 _board.CONNECT_RETRIES = 1
 sys.modules["board"] = _board
+if "micropython" not in sys.modules:
+    _mp = types.ModuleType("micropython")
+    _mp.viper = lambda f: f
+    _mp.native = lambda f: f
+    sys.modules["micropython"] = _mp
 
 # Another test module (test_auto_connect) stubs sys.modules["ble_bridge"] with a
 # SimpleNamespace that has no connect(). When the whole suite is discovered in one
@@ -464,15 +460,15 @@ class TestStartNotifySubscribesCccd(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(got, [(char.uuid, b"\xaa\x02\x00\xa3\x30\x00\x00\x00")])
         await bridge.disconnect()
 
-    async def test_read_rearms_after_timeout(self):
-        """A 10s idle raises asyncio.TimeoutError; the loop must re-arm and keep
-        reading while connected, not die and drop a late final frame (#248)."""
+    async def test_read_waits_without_timeout(self):
+        """The reader waits with no timeout_ms, so an idle gap before a late
+        final frame cannot expire the wait and kill the loop (#248), and aioble
+        spawns no timeout task per read."""
         bridge = ble_bridge.BleBridge()
         char = _SubscribableFakeChar(
             "0000ffb3-0000-1000-8000-00805f9b34fb",
             _bt.FLAG_INDICATE,
             indicate_data=b"\xaa\x02\x00\xa3\x30\x00\x00\x00",
-            timeouts_before_data=1,
         )
         bridge._chars[char.uuid] = char
         bridge._conn = _FakeConn()
@@ -486,7 +482,7 @@ class TestStartNotifySubscribesCccd(unittest.IsolatedAsyncioTestCase):
 
         await bridge.start_notify(char.uuid, publish_fn)
         await asyncio.wait_for(done.wait(), 1.0)
-        self.assertGreaterEqual(char.indicated_calls, 2)  # timed out once, then delivered
+        self.assertEqual(set(char.read_timeouts), {None})
         self.assertEqual(got, [(char.uuid, b"\xaa\x02\x00\xa3\x30\x00\x00\x00")])
         await bridge.disconnect()
 
@@ -58,8 +58,8 @@ if "ble_bridge" not in sys.modules:
         start_streaming=lambda: None,
         stop_streaming=lambda: None,
         has_pending_scale_mac=lambda macs: False,
+        find_pending_scale=lambda macs: None,
         drain_results=lambda: [],
-        _raw_results=[],
     )
     sys.modules["ble_bridge"] = _ble_bridge
 
@@ -321,6 +321,32 @@ class SessionGuardTest(unittest.TestCase):
         self.assertFalse(main._scan_paused)
 
 
+class PendingQueueTest(unittest.TestCase):
+    """on_message refuses commands before the bounded deque would evict one."""
+
+    def setUp(self):
+        self._orig_pending = main._pending
+        main._pending = main.deque((), main._PENDING_MAX)
+        main._gatt_session_armed = False
+
+    def tearDown(self):
+        main._pending = self._orig_pending
+
+    def test_full_queue_drops_new_commands_not_queued_ones(self):
+        for i in range(main._PENDING_MAX + 4):
+            main.on_message(main.topic(f"write/{i}"), b"", False)
+        self.assertEqual(len(main._pending), main._PENDING_MAX - 1)
+        self.assertEqual(main._pending[0][0], main.topic("write/0"))
+
+    def test_disconnect_sentinel_is_never_evicted(self):
+        for _ in range(main._PENDING_MAX):
+            main.on_message(main.topic("connect"), b"{}", False)
+        main._on_ble_disconnect()
+        self.assertEqual(len(main._pending), main._PENDING_MAX)
+        self.assertEqual(main._pending[-1][0], "__ble_disconnected__")
+        self.assertEqual(main._pending[0][0], main.topic("connect"))
+
+
 class BridgeDisconnectTest(unittest.TestCase):
     """BleBridge.notify_disconnected fires the callback at most once."""
 
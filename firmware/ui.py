@@ -10,9 +10,10 @@ States: STARTUP -> IDLE -> SCALE_DETECTED -> READING -> RESULT -> IDLE
 Hardware init is handled by board_guition_4848.init_display() using the
 rgb_panel_lvgl C module.  This module only manages the UI layer on top.
 LVGL tick is driven by an esp_timer in the C driver (no Python tick_inc needed).
+Indicator fades and state timeouts are LVGL timers, so they fire from LVGL's
+own timer handler instead of being polled from the main loop.
 """
 
-import time
 import board
 
 # ─── State constants ──────────────────────────────────────────────────────────
@@ -48,7 +49,6 @@ _DIM_TEXT = 0x475569
 # ─── Module state ─────────────────────────────────────────────────────────────
 
 _state = STARTUP
-_state_entered = 0
 _users = []
 _initialised = False
 
@@ -76,21 +76,41 @@ _lbl_mqtt_text = None
 _lbl_ble_icon = None
 _lbl_ble_text = None
 
-# Flash timing
-_scan_flash_time = 0
-_pub_flash_time = 0
+# LVGL timers (created paused in init, armed on demand)
+_scan_fade_timer = None
+_pub_fade_timer = None
+_state_timer = None
 
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
 def _set_state(new_state):
-    global _state, _state_entered
+    global _state
     _state = new_state
-    _state_entered = time.ticks_ms()
+    if _state_timer is None:
+        return
+    # Re-arm the state timeout for states that expire; any transition cancels
+    # the previous one.
+    _state_timer.pause()
+    if new_state == SCALE_DETECTED:
+        _arm(_state_timer, _SCALE_DETECTED_TIMEOUT_MS)
+    elif new_state == RESULT:
+        _arm(_state_timer, _RESULT_TIMEOUT_MS)
+
+
+def _arm(timer, period_ms=None):
+    """(Re)start a paused one-shot timer from now."""
+    if period_ms is not None:
+        timer.set_period(period_ms)
+    timer.reset()
+    timer.resume()
 
 
-def _elapsed_ms():
-    return time.ticks_diff(time.ticks_ms(), _state_entered)
+def _new_timer(lv, cb, period_ms):
+    """Create a paused timer; callbacks pause it again so it acts as a one-shot."""
+    timer = lv.timer_create(cb, period_ms, None)
+    timer.pause()
+    return timer
 
 
 def _color(hex_val):
@@ -108,6 +128,7 @@ def init():
     global _sbar, _lbl_wifi_icon, _lbl_wifi_text
     global _lbl_mqtt_icon, _lbl_mqtt_text
     global _lbl_ble_icon, _lbl_ble_text
+    global _scan_fade_timer, _pub_fade_timer, _state_timer
 
     if not board.HAS_DISPLAY:
         return
@@ -274,6 +295,10 @@ def init():
     _lbl_ble_text.set_width(160)
     _lbl_ble_text.set_pos(320, 32)
 
+    _scan_fade_timer = _new_timer(lv, _fade_scan_dot, _FLASH_MS)
+    _pub_fade_timer = _new_timer(lv, _fade_pub_dot, _FLASH_MS)
+    _state_timer = _new_timer(lv, _on_state_timeout, _RESULT_TIMEOUT_MS)
+
     _initialised = True
     _set_state(STARTUP)
     print("UI initialised (STARTUP)")
@@ -418,20 +443,18 @@ def on_mqtt_change(connected):
 
 def on_scan_tick(count=0):
     """Flash BLE scan indicator sky-blue."""
-    global _scan_flash_time
     if not board.HAS_DISPLAY or not _initialised:
         return
-    _scan_flash_time = time.ticks_ms()
+    _arm(_scan_fade_timer)
     _lbl_ble_icon.set_style_text_color(_color(_SKY), 0)
     _lbl_ble_text.set_style_text_color(_color(_SKY), 0)
 
 
 def on_publish_tick():
     """Flash MQTT indicator bright on publish."""
-    global _pub_flash_time
     if not board.HAS_DISPLAY or not _initialised:
         return
-    _pub_flash_time = time.ticks_ms()
+    _arm(_pub_fade_timer)
     _lbl_mqtt_icon.set_style_text_color(_color(_WHITE), 0)
     _lbl_mqtt_text.set_style_text_color(_color(_WHITE), 0)
 
@@ -497,44 +520,45 @@ def _update_users_label():
         _lbl_users.set_text("")
 
 
-def check_timeout():
-    """Handle flash fades, state timeouts, and tick LVGL. Call every loop iteration."""
-    global _scan_flash_time, _pub_flash_time
-    if not board.HAS_DISPLAY or not _initialised:
-        return
+# ─── Timer callbacks ──────────────────────────────────────────────────────────
 
-    import lvgl as lv
-    now = time.ticks_ms()
+def _fade_scan_dot(timer):
+    """Fade the BLE scan flash back to dim."""
+    timer.pause()
+    _lbl_ble_icon.set_style_text_color(_color(_DIM), 0)
+    _lbl_ble_text.set_style_text_color(_color(_DIM), 0)
 
-    # Fade BLE scan flash
-    if _scan_flash_time and time.ticks_diff(now, _scan_flash_time) > _FLASH_MS:
-        _lbl_ble_icon.set_style_text_color(_color(_DIM), 0)
-        _lbl_ble_text.set_style_text_color(_color(_DIM), 0)
-        _scan_flash_time = 0
 
-    # Fade MQTT publish flash — restore to current connection color
-    if _pub_flash_time and time.ticks_diff(now, _pub_flash_time) > _FLASH_MS:
-        c = _INDIGO if _mqtt_connected else _RED
-        _lbl_mqtt_icon.set_style_text_color(_color(c), 0)
-        _lbl_mqtt_text.set_style_text_color(_color(c), 0)
-        _pub_flash_time = 0
+def _fade_pub_dot(timer):
+    """Fade the MQTT publish flash back to the current connection color."""
+    timer.pause()
+    c = _INDIGO if _mqtt_connected else _RED
+    _lbl_mqtt_icon.set_style_text_color(_color(c), 0)
+    _lbl_mqtt_text.set_style_text_color(_color(c), 0)
 
-    # State timeouts
-    elapsed = _elapsed_ms()
 
-    if _state == SCALE_DETECTED and elapsed > _SCALE_DETECTED_TIMEOUT_MS:
+def _on_state_timeout(timer):
+    """Return to IDLE when SCALE_DETECTED or RESULT has been shown too long."""
+    timer.pause()
+    if _state == SCALE_DETECTED:
         print("UI: scale detected timeout")
         _set_state(IDLE)
         _show_idle()
         _lbl_hdr_scale.set_style_text_color(_color(_DIM), 0)
-
-    elif _state == RESULT and elapsed > _RESULT_TIMEOUT_MS:
+    elif _state == RESULT:
         _set_state(IDLE)
         _show_idle()
 
-    # Process pending LVGL renders (tick is handled by C esp_timer)
+
+def check_timeout():
+    """Run LVGL's timer handler: renders plus the fade/timeout timers. Call every loop iteration."""
+    if not board.HAS_DISPLAY or not _initialised:
+        return
+
+    import lvgl as lv
+
+    # Process pending LVGL renders and due timers (tick is handled by C esp_timer)
     try:
         lv.task_handler()
     except Exception:
         pass
-
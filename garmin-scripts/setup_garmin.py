@@ -1,7 +1,7 @@
 import argparse
 import os
-import re
 import sys
+from collections import namedtuple
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -10,6 +10,8 @@ from garminconnect import Garmin
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 load_dotenv(PROJECT_ROOT / ".env")
 
+GarminUser = namedtuple("GarminUser", "name email password token_dir")
+
 
 def get_token_dir(token_dir=None):
     if token_dir:
@@ -17,8 +19,9 @@ def get_token_dir(token_dir=None):
     custom = os.environ.get("TOKEN_DIR", "").strip()
     if custom:
         return str(Path(custom).expanduser())
-    new = Path.home() / ".garmin_tokens"
-    old = Path.home() / ".garmin_renpho_tokens"
+    home = Path.home()
+    new = home / ".garmin_tokens"
+    old = home / ".garmin_renpho_tokens"
     if old.is_dir() and not new.is_dir():
         return str(old)
     return str(new)
@@ -51,19 +54,39 @@ def resolve_env_ref(value):
     """Resolve ${ENV_VAR} references in config values (matching TS behavior)."""
     if not isinstance(value, str):
         return value
+    if "$" not in value:
+        return value
 
-    def replacer(match):
-        var_name = match.group(1)
+    # Scan with str.find rather than a regex: a value holds one or two
+    # references at most. Matches ${NAME} with a non-empty NAME, like
+    # ENV_REF_REGEX in src/config/env-refs.ts.
+    parts = []
+    pos = 0
+    i = value.find("${")
+    while i != -1:
+        end = value.find("}", i + 2)
+        if end == -1:
+            break
+        if end == i + 2:
+            i = value.find("${", i + 1)
+            continue
+        var_name = value[i + 2 : end]
         env_val = os.environ.get(var_name)
         if env_val is None:
             print(
                 f"[Setup] Warning: environment variable '{var_name}' is not set",
                 file=sys.stderr,
             )
-            return match.group(0)
-        return env_val
+        else:
+            parts.append(value[pos:i])
+            parts.append(env_val)
+            pos = end + 1
+        i = value.find("${", end + 1)
 
-    return re.sub(r"\$\{([^}]+)\}", replacer, value)
+    if not parts:
+        return value
+    parts.append(value[pos:])
+    return "".join(parts)
 
 
 def authenticate(email, password, token_dir):
@@ -119,9 +142,11 @@ def load_config(config_path):
         )
         sys.exit(1)
 
+    # libyaml-backed loader when PyYAML was built with it; same safe semantics.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        with open(config_path, "r") as f:
-            return yaml.safe_load(f)
+        with open(config_path, "rb") as f:
+            return yaml.load(f, Loader=loader)
     except FileNotFoundError:
         print(f"Error: Config file not found: {config_path}", file=sys.stderr)
         sys.exit(1)
@@ -131,37 +156,41 @@ def load_config(config_path):
 
 
 def get_garmin_users(config):
-    """Extract Garmin users from config. Returns list of (name, email, password, token_dir)."""
+    """Extract Garmin users from config. Returns a list of GarminUser tuples.
+
+    email and password are returned as written in the config; ${VAR}
+    references are resolved by the caller, once it knows which users it sets up.
+    """
     users = config.get("users", [])
     global_exporters = config.get("global_exporters", [])
     results = []
 
-    # Per-user garmin entries
+    # Per-user garmin entries. Names are collected in the same pass so the
+    # global fallback below does not walk the users again.
+    names = []
     for user in users:
-        for entry in user.get("exporters", []):
-            if entry.get("type") == "garmin":
-                results.append(
-                    {
-                        "name": user.get("name", "Unknown"),
-                        "email": resolve_env_ref(entry.get("email", "")),
-                        "password": resolve_env_ref(entry.get("password", "")),
-                        "token_dir": entry.get("token_dir", ""),
-                    }
+        name = user.get("name", "Unknown")
+        names.append(name)
+        garmin = [e for e in user.get("exporters", []) if e.get("type") == "garmin"]
+        for entry in garmin:
+            get = entry.get
+            results.append(
+                GarminUser(
+                    name, get("email", ""), get("password", ""), get("token_dir", "")
                 )
+            )
 
     # Global garmin entries apply to all users (only if no per-user entries found)
     if not results:
-        for entry in global_exporters:
-            if entry.get("type") == "garmin":
-                for user in users:
-                    results.append(
-                        {
-                            "name": user.get("name", "Unknown"),
-                            "email": resolve_env_ref(entry.get("email", "")),
-                            "password": resolve_env_ref(entry.get("password", "")),
-                            "token_dir": entry.get("token_dir", ""),
-                        }
-                    )
+        global_garmin = [e for e in global_exporters if e.get("type") == "garmin"]
+        for entry in global_garmin:
+            get = entry.get
+            email = get("email", "")
+            password = get("password", "")
+            token_dir = get("token_dir", "")
+            results.extend(
+                GarminUser(name, email, password, token_dir) for name in names
+            )
 
     return results
 
@@ -176,7 +205,7 @@ def run_from_config(config_path, target_user=None, cli_token_dir=None):
         sys.exit(1)
 
     if target_user:
-        garmin_users = [u for u in garmin_users if u["name"] == target_user]
+        garmin_users = [u for u in garmin_users if u.name == target_user]
         if not garmin_users:
             print(
                 f"[Setup] User '{target_user}' not found in config "
@@ -185,23 +214,23 @@ def run_from_config(config_path, target_user=None, cli_token_dir=None):
             sys.exit(1)
 
     has_error = False
-    for user in garmin_users:
+    for name, email, password, user_token_dir in garmin_users:
         print(f"\n[Setup] ===========================================")
-        print(f"[Setup] Setting up Garmin for user: {user['name']}")
+        print(f"[Setup] Setting up Garmin for user: {name}")
         print(f"[Setup] ===========================================")
 
-        email = (user.get("email") or "").strip()
-        password = (user.get("password") or "").strip()
+        email = (resolve_env_ref(email) or "").strip()
+        password = (resolve_env_ref(password) or "").strip()
 
         if not email or not password:
             print(
-                f"[Setup] Error: Missing email or password for user {user['name']}."
+                f"[Setup] Error: Missing email or password for user {name}."
             )
             print("[Setup] Add credentials to config.yaml or set env vars.")
             has_error = True
             continue
 
-        token_dir = get_token_dir(cli_token_dir or user.get("token_dir") or None)
+        token_dir = get_token_dir(cli_token_dir or user_token_dir or None)
 
         if not authenticate(email, password, token_dir):
             has_error = True